@@ -1,5 +1,6 @@
 from enum import Enum
 import argparse
+import copy
 import json
 import os
 
@@ -17,6 +18,9 @@ def parse_arguments() -> argparse.Namespace:
     arg_parser.add_argument('--default_sources_json_file', const=1, type=str, nargs='?')
     arg_parser.add_argument('--wconsole_dir', const=1, type=str, nargs='?')
     arg_parser.add_argument('--conversion_setting', const=1, type=str, nargs='?')
+    arg_parser.add_argument('--multi_language', const=1, default=False, type=bool, nargs='?')
+    arg_parser.add_argument('--max_workers', const=1, default=None, type=int, nargs='?')
+    arg_parser.add_argument('--media_info_binary', const=1, default=False, type=bool, nargs='?')
 
     return arg_parser.parse_args()
 
@@ -77,3 +81,15 @@ class WwiseSourcesPaths:
         self.DEFAULT_SOURCES_INFO_FILE = os.path.join(self.SOUND_BANKS_DIR, self._args.default_sources_json_file)
         self.WWISE_CONSOLE_DIR = self._args.wconsole_dir
         self.CONVERSION_SETTING_NAME = self._args.conversion_setting
+        self.MULTI_LANGUAGE = self._args.multi_language
+        self.MAX_WORKERS = self._args.max_workers
+        self.MEDIA_INFO_BINARY = self._args.media_info_binary
+        self.LANGUAGE = None
+
+    def for_language(self, language: str) -> 'WwiseSourcesPaths':
+        """Creates a copy of the paths that scans a single language subfolder of the voices directory.
+        The generated files are written to a language subfolder of each platform's output directory"""
+        language_paths = copy.copy(self)
+        language_paths.ORIGINAL_VOICES_DIR = os.path.join(self.ORIGINAL_VOICES_DIR, language)
+        language_paths.LANGUAGE = language
+        return language_paths
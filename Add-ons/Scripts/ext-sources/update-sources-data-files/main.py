@@ -14,12 +14,15 @@
 #============================================================================================================#
 
 import config
+import media_info_table
 import wwise_sources_parser as wparser
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from xml.etree.ElementTree import indent
 import asyncio
 import json
 import os
+import time
 
 # HELPERS
 
@@ -84,6 +87,7 @@ def update_ext_sources_data_files(paths: config.WwiseSourcesPaths, platform: con
     Generates two files:
     1. Platform-specific .wsources XML file containing source audio files
     2. Platform-specific media info JSON file containing metadata for each converted audio file
+       (optionally also written as a packed binary table, see media_info_table.py)
     
     The .wsources file is used by Wwise to convert .wav files to .wem format, while the media info
     JSON provides runtime configuration (codec, streaming settings, memory alignment, etc.) for the
@@ -93,7 +97,7 @@ def update_ext_sources_data_files(paths: config.WwiseSourcesPaths, platform: con
     media_info_list = []
     xml_tree, destinations = wparser.get_wsources_xml_tree_and_source_destinations(paths)
 
-    wsources_xml_file = os.path.join(paths.SOUND_BANKS_DIR, platform.value, f"ExternalSources_{platform.value}.wsources")
+    wsources_xml_file = wparser.get_wsources_xml_file(platform, paths)
     os.makedirs(os.path.dirname(wsources_xml_file), exist_ok=True)
 
     with open(wsources_xml_file, 'w'):
@@ -113,6 +117,61 @@ def update_ext_sources_data_files(paths: config.WwiseSourcesPaths, platform: con
     with open(wparser.get_media_info_json_file(platform, paths), "w") as media_info_json_file:
         media_info_json_file.write(formatted_json)
 
+    if paths.MEDIA_INFO_BINARY:
+        media_info_table.write_media_info_table(media_info_list, wparser.get_media_info_table_file(platform, paths))
+
+def update_all_platforms_data_files(paths: config.WwiseSourcesPaths):
+    """Updates the Wwise external source data files of every platform defined in the config.py file."""
+    for config_platform in config.Platforms:
+        update_ext_sources_data_files(paths, config_platform, config.IS_STREAMED,
+                                      config.USE_DEVICE_MEMORY, config.MEMORY_ALIGNMENT, config.PREFETCH_SIZE)
+
+def update_language_data_files(paths: config.WwiseSourcesPaths) -> tuple[str, float]:
+    """Worker process entry point. Updates the data files of a single language and returns its elapsed time."""
+    start_time = time.perf_counter()
+    update_all_platforms_data_files(paths)
+    return paths.LANGUAGE, time.perf_counter() - start_time
+
+def update_multi_language_data_files(paths: config.WwiseSourcesPaths):
+    """
+    Updates the Wwise external source data files of every language subfolder found in the voices directory.
+
+    Each language is scanned and written in its own worker process. The external source cookie IDs
+    don't depend on the language, so they are fetched only once before the workers start.
+    """
+
+    if not os.path.isdir(paths.ORIGINAL_VOICES_DIR):
+        print(f"Voices directory not found: {paths.ORIGINAL_VOICES_DIR}")
+        return
+
+    languages = wparser.get_language_list(paths.ORIGINAL_VOICES_DIR)
+
+    # Only language subfolders are processed, warn about files that would be left out
+    loose_assets = wparser.get_loose_audio_asset_list(paths.ORIGINAL_VOICES_DIR)
+    if loose_assets:
+        print(f"Warning: {len(loose_assets)} .wav files outside a language subfolder are skipped:")
+        for loose_asset in loose_assets:
+            print(f"  {loose_asset.name}")
+
+    if not languages:
+        print(f"No language subfolders found in {paths.ORIGINAL_VOICES_DIR}")
+        return
+
+    start_time = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=paths.MAX_WORKERS) as executor:
+        futures = {executor.submit(update_language_data_files, paths.for_language(language)): language
+                   for language in languages}
+
+        for future in as_completed(futures):
+            try:
+                language, elapsed_time = future.result()
+                print(f"{language}: {elapsed_time:.2f}s")
+            except Exception as e:
+                print(f"{futures[future]}: An error occurred: {e}")
+
+    print(f"Total ({len(languages)} languages): {time.perf_counter() - start_time:.2f}s")
+
 
 ## MAIN PROCESS ##
 
@@ -124,6 +183,7 @@ if __name__ == "__main__":
     
     update_default_sources_info_json_file(config_paths)
 
-    for config_platform in config.Platforms:
-        update_ext_sources_data_files(config_paths, config_platform, config.IS_STREAMED,
-                                      config.USE_DEVICE_MEMORY, config.MEMORY_ALIGNMENT, config.PREFETCH_SIZE)
\ No newline at end of file
+    if config_paths.MULTI_LANGUAGE:
+        update_multi_language_data_files(config_paths)
+    else:
+        update_all_platforms_data_files(config_paths)
\ No newline at end of file
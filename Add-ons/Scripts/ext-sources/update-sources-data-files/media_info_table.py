@@ -0,0 +1,183 @@
+#============================================================================================================#
+# Created by Horacio Valdivieso
+
+# Packed binary version of the ExtSources_MediaInfo_<Platform>.json files.
+# It stores the same records as the JSON file in a fixed-width table with a pooled string block and a sorted ID index,
+# so the game can memory-map the file and find any entry with a binary search instead of parsing JSON at startup.
+
+# File layout (little-endian):
+
+## Header:       magic 'WMIT' | version (u16) | record size (u16) | record count (u32) | string pool offset (u32)
+## ID index:     record count * media info ID (u32), sorted in ascending order
+## Records:      record count * fixed-width record, in the same order as the ID index
+## String pool:  UTF-8 media names, each unique name stored once
+
+# Verify a binary table against its JSON file with:
+
+## py media_info_table.py --json_file <ExtSources_MediaInfo_Platform.json> --table_file <ExtSources_MediaInfo_Platform.bin>
+#============================================================================================================#
+
+from typing import Optional
+import argparse
+import json
+import mmap
+import struct
+
+# CONSTANTS
+
+TABLE_MAGIC : bytes = b'WMIT'
+TABLE_VERSION : int = 1
+
+# Magic, version, record size, record count, string pool offset
+HEADER_STRUCT = struct.Struct('<4sHHII')
+INDEX_STRUCT = struct.Struct('<I')
+# ID, name offset, name length, codec ID, is streamed, use device memory, padding, memory alignment, prefetch size
+RECORD_STRUCT = struct.Struct('<IIHHBB2xII')
+
+
+# WRITER
+
+def write_media_info_table(media_info_list: list[dict], table_file: str):
+    """Writes the media info entries created by create_media_info_entry to a packed binary table file."""
+
+    sorted_entries = sorted(media_info_list, key=lambda entry: entry["ExternalSourceMediaInfoId"])
+
+    string_pool = bytearray()
+    string_offsets = {}
+    index_block = bytearray()
+    record_block = bytearray()
+
+    for entry in sorted_entries:
+        media_name = entry["MediaName"]
+
+        if media_name not in string_offsets:
+            string_offsets[media_name] = len(string_pool)
+            string_pool += media_name.encode('utf-8')
+
+        index_block += INDEX_STRUCT.pack(entry["ExternalSourceMediaInfoId"])
+        record_block += RECORD_STRUCT.pack(entry["ExternalSourceMediaInfoId"],
+                                           string_offsets[media_name],
+                                           len(media_name.encode('utf-8')),
+                                           entry["CodecID"],
+                                           entry["bIsStreamed"],
+                                           entry["bUseDeviceMemory"],
+                                           entry["MemoryAlignment"],
+                                           entry["PrefetchSize"])
+
+    string_pool_offset = HEADER_STRUCT.size + len(index_block) + len(record_block)
+    header = HEADER_STRUCT.pack(TABLE_MAGIC, TABLE_VERSION, RECORD_STRUCT.size, len(sorted_entries), string_pool_offset)
+
+    with open(table_file, "wb") as media_info_table_file:
+        media_info_table_file.write(header)
+        media_info_table_file.write(index_block)
+        media_info_table_file.write(record_block)
+        media_info_table_file.write(string_pool)
+
+
+# READER
+
+class MediaInfoTable:
+    """Memory-mapped reader of a packed binary media info table.
+    Entries are returned as dictionaries with the same keys as the media info JSON file."""
+
+    def __init__(self, table_file: str):
+        with open(table_file, "rb") as media_info_table_file:
+            self._buffer = mmap.mmap(media_info_table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_size, self._count, self._string_pool_offset = HEADER_STRUCT.unpack_from(self._buffer, 0)
+
+        if magic != TABLE_MAGIC or version != TABLE_VERSION or record_size != RECORD_STRUCT.size:
+            self._buffer.close()
+            raise ValueError(f"{table_file} is not a version {TABLE_VERSION} media info table")
+
+        self._index_offset = HEADER_STRUCT.size
+        self._records_offset = self._index_offset + self._count * INDEX_STRUCT.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self._read_record(position)
+
+    def close(self):
+        self._buffer.close()
+
+    def get(self, media_info_id: int) -> Optional[dict]:
+        """Finds an entry by its media info ID with a binary search on the ID index. Returns None if not found."""
+        low, high = 0, self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            middle_id = INDEX_STRUCT.unpack_from(self._buffer, self._index_offset + middle * INDEX_STRUCT.size)[0]
+
+            if middle_id < media_info_id:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self._count and INDEX_STRUCT.unpack_from(self._buffer, self._index_offset + low * INDEX_STRUCT.size)[0] == media_info_id:
+            return self._read_record(low)
+        return None
+
+    def _read_record(self, position: int) -> dict:
+        (media_info_id, name_offset, name_length, codec_id, is_streamed,
+         use_device_memory, memory_alignment, prefetch_size) = RECORD_STRUCT.unpack_from(
+            self._buffer, self._records_offset + position * RECORD_STRUCT.size)
+
+        name_start = self._string_pool_offset + name_offset
+        media_name = self._buffer[name_start:name_start + name_length].decode('utf-8')
+
+        return {
+            "Name": media_info_id,
+            "ExternalSourceMediaInfoId": media_info_id,
+            "MediaName": media_name,
+            "CodecID": codec_id,
+            "bIsStreamed": bool(is_streamed),
+            "bUseDeviceMemory": bool(use_device_memory),
+            "MemoryAlignment": memory_alignment,
+            "PrefetchSize": prefetch_size
+        }
+
+
+# VERIFICATION
+
+def verify_media_info_table(json_file: str, table_file: str) -> bool:
+    """Checks that every entry of the media info JSON file round-trips through the binary table."""
+
+    with open(json_file, "r") as media_info_json_file:
+        media_info_list = json.load(media_info_json_file)
+
+    with MediaInfoTable(table_file) as table:
+        if len(table) != len(media_info_list):
+            print(f"Entry count mismatch: JSON has {len(media_info_list)}, table has {len(table)}")
+            return False
+
+        for entry in media_info_list:
+            table_entry = table.get(entry["ExternalSourceMediaInfoId"])
+            if table_entry != entry:
+                print(f"Entry mismatch: JSON {entry}, table {table_entry}")
+                return False
+
+    return True
+
+
+## MAIN PROCESS ##
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description='Verify a packed binary media info table against its JSON file.')
+    arg_parser.add_argument('--json_file', const=1, type=str, nargs='?')
+    arg_parser.add_argument('--table_file', const=1, type=str, nargs='?')
+    args = arg_parser.parse_args()
+
+    if verify_media_info_table(args.json_file, args.table_file):
+        print(f"{args.table_file} matches {args.json_file}")
+    else:
+        raise SystemExit(1)
@@ -7,9 +7,23 @@ import os
 import pathlib
 import subprocess
 
+def get_platform_output_dir(platform: Enum, paths: config.WwiseSourcesPaths):
+    """Gets the current platform's output directory, including the language subfolder in multi-language mode"""
+    if paths.LANGUAGE:
+        return os.path.join(paths.SOUND_BANKS_DIR, f'{platform.value}', paths.LANGUAGE)
+    return os.path.join(paths.SOUND_BANKS_DIR, f'{platform.value}')
+
+def get_wsources_xml_file(platform: Enum, paths: config.WwiseSourcesPaths):
+    """Gets the current platform's .wsources file defined in the config.py file"""
+    return os.path.join(get_platform_output_dir(platform, paths), f'ExternalSources_{platform.value}.wsources')
+
 def get_media_info_json_file(platform: Enum, paths: config.WwiseSourcesPaths):
     """Gets the current platform's Media Info JSON file defined in the config.py file"""
-    return os.path.join(paths.SOUND_BANKS_DIR, f'{platform.value}', f'ExtSources_MediaInfo_{platform.value}.json')
+    return os.path.join(get_platform_output_dir(platform, paths), f'ExtSources_MediaInfo_{platform.value}.json')
+
+def get_media_info_table_file(platform: Enum, paths: config.WwiseSourcesPaths):
+    """Gets the current platform's packed binary Media Info table file, written next to the Media Info JSON file"""
+    return os.path.join(get_platform_output_dir(platform, paths), f'ExtSources_MediaInfo_{platform.value}.bin')
 
 def get_ext_source_cookie_ids(paths: config.WwiseSourcesPaths, use_wwise_console_waapi_server: bool = True):
     """Gets the name and short ID (cookie) of all external sources inputs found in the Wwise project.
@@ -39,6 +53,20 @@ def get_ext_source_cookie_ids(paths: config.WwiseSourcesPaths, use_wwise_console
         print(f"An error occurred: {e}")
         return None
 
+def get_language_list(folder_path):
+    """Gets the names of all the language subfolders (e.g. English(US)) in the provided folder path.
+    Returns an empty list if the folder doesn't exist"""
+    if not os.path.isdir(folder_path):
+        return []
+    language_dir_list = pathlib.Path(folder_path)
+    return sorted(entry.name for entry in language_dir_list.iterdir() if entry.is_dir())
+
+def get_loose_audio_asset_list(folder_path):
+    """Gets the .wav files found directly in the provided folder path, outside any language subfolder"""
+    if not os.path.isdir(folder_path):
+        return []
+    return sorted(pathlib.Path(folder_path).glob("*.wav"))
+
 def get_audio_asset_list(folder_path):
     """Gets all the .wav files full path in the provided folder path"""
     audio_file_list = pathlib.Path(folder_path)
@@ -58,6 +86,19 @@ def get_clean_wem_destination(asset_path: pathlib.Path, start_dir_index: int = -
         return "/"[0].join(part_list).replace(".wav", ".wem")
     return ""
 
+def get_language_relative_asset_path(asset_path: pathlib.Path, paths: config.WwiseSourcesPaths, language_dir_parts: int = 3):
+    """Extract the relative path of an asset in a language folder, starting like get_relative_asset_path (e.g. Originals/Voices/English(US)).
+    Unlike get_relative_asset_path, files nested in subfolders keep their full path"""
+    language_dir = pathlib.Path(paths.ORIGINAL_VOICES_DIR)
+    part_list = language_dir.parts[-language_dir_parts:] + asset_path.relative_to(language_dir).parts
+    return "/".join(part_list)
+
+def get_language_wem_destination(asset_path: pathlib.Path, paths: config.WwiseSourcesPaths):
+    """Extract the path of a .wav asset relative to its language folder, prefixed by the language, and replace it with .wem.
+    Unlike get_clean_wem_destination, files nested in subfolders keep the language prefix (e.g. English(US)/sub/a.wem)"""
+    relative_path = asset_path.relative_to(paths.ORIGINAL_VOICES_DIR).as_posix()
+    return f"{paths.LANGUAGE}/{relative_path}".replace(".wav", ".wem")
+
 def get_wsources_xml_tree_and_source_destinations(paths: config.WwiseSourcesPaths):
     """Finds the current platform's .wsources file defined in the config.py file.
     Updates the file with the latest changes and gets the list of destinations"""
@@ -73,8 +114,12 @@ def get_wsources_xml_tree_and_source_destinations(paths: config.WwiseSourcesPath
     audio_asset_list = get_audio_asset_list(paths.ORIGINAL_VOICES_DIR)
 
     for asset in audio_asset_list:
-        wav_file_origin: str = get_relative_asset_path(asset)
-        wem_file_destination = get_clean_wem_destination(asset)
+        if paths.LANGUAGE:
+            wav_file_origin: str = get_language_relative_asset_path(asset, paths)
+            wem_file_destination = get_language_wem_destination(asset, paths)
+        else:
+            wav_file_origin: str = get_relative_asset_path(asset)
+            wem_file_destination = get_clean_wem_destination(asset)
 
         # Create Source element
         source_element = Element('Source')
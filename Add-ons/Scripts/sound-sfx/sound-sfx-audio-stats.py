@@ -0,0 +1,321 @@
+#============================================================================================================#
+# Created by Horacio Valdivieso
+
+# This script scans the original .wav file of every Audio File Source in the project (or under the selected objects)
+# and writes a columnar report with their peak level, leading and trailing silence, duration, channels and sample rate.
+# Useful to know what is in the project before trimming sounds or resetting volumes.
+
+# The files are analyzed in parallel worker processes. The results are cached next to the report,
+# so a new scan only reads the files that were added or changed since the previous one.
+
+# It requires these packages:
+
+## py -m pip install waapi-client
+## py -m pip install scipy
+
+# It's accessed by commands in this file:
+
+## Add-ons/Commands/sound-sfx/sound-sfx-audio-stats-cmds.json
+#============================================================================================================#
+
+from concurrent.futures import ProcessPoolExecutor
+from scipy.io import wavfile
+from typing import Optional
+from waapi import WaapiClient, CannotConnectToWaapiException
+import argparse
+import asyncio
+import csv
+import numpy as np
+import os
+import time
+
+# CONSTANTS
+
+WAAPI_ALLOW_EXCEPTIONS : bool = True
+WAAPI_URL : str = "ws://127.0.0.1:8080/waapi"
+
+MAX_INT32 = 2147483647
+MAX_INT16 = 32767
+MAX_UINT8_HALF = 128
+DECIBEL_TO_LINEAR_MULTIPLIER = 0.05
+DEFAULT_THRESHOLD_DB = -54
+DEFAULT_CHUNK_SIZE = 64
+
+REPORT_FILE_NAME : str = "AudioStats"
+SELECTED_REPORT_FILE_NAME : str = "AudioStats_Selected"
+CACHE_FILE_NAME : str = "AudioStatsCache.npz"
+
+# Columns stored in the cache, one entry per .wav file
+CACHE_COLUMNS = ["path", "mtime_ns", "size", "duration", "channels", "sample_rate",
+                 "peak_db", "leading_silence", "trailing_silence"]
+# Columns written in the report, one entry per Audio File Source
+REPORT_COLUMNS = ["id", "name", "status"] + CACHE_COLUMNS
+
+# Report status of each Audio File Source
+STATUS_OK : str = "ok"
+STATUS_UNREADABLE : str = "unreadable"
+STATUS_NO_PATH : str = "no_path"
+
+# CONFIG
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Scan Audio File Sources and write a report with the statistics of their original .wav files.'
+    )
+    parser.add_argument('--output_dir', const=1, type=str, nargs='?',
+                        help='Directory where the report and the cache are written')
+    parser.add_argument('--report_format', const=1, default='csv', type=str, nargs='?', choices=['csv', 'npz'],
+                        help='Format of the report: csv or npz (NumPy columnar arrays)')
+    parser.add_argument('--threshold', const=1, default=DEFAULT_THRESHOLD_DB, type=int, nargs='?',
+                        help='Threshold in decibels under which the begin and end are considered silent')
+    parser.add_argument('--selected_only', const=1, default=False, type=bool, nargs='?',
+                        help='Only scan the Audio File Sources under the objects selected in the authoring tool')
+    parser.add_argument('--no_cache', const=1, default=False, type=bool, nargs='?',
+                        help='Ignore the cached results and read every file again')
+    parser.add_argument('--max_workers', const=1, default=None, type=int, nargs='?',
+                        help='Maximum number of worker processes (defaults to the CPU count)')
+    return parser.parse_args()
+
+
+# HELPERS
+
+def handle_py_asyncio_event_loop() -> asyncio.AbstractEventLoop:
+    """Handle the asyncio event loop for Python versions 3.10 and below."""
+
+    try: # For Python Pre 3.10
+        loop = asyncio.get_event_loop()
+    except RuntimeError: # For Python 3.10+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop
+
+# Convert the threshold value from decibels to linear
+# dB to linear = 10^(db/20) or 10^(db*(1/20)) or 10^(db*0.05)
+def get_threshold_value_linear(db: float) -> float:
+    return pow(10, db * DECIBEL_TO_LINEAR_MULTIPLIER)
+
+def convert_audio_data_to_float(audio_data: np.ndarray) -> np.ndarray:
+    """Convert the raw data to float values in the -1 to 1 range, with one column per channel.
+    Signed integer formats missing from the conversion map (e.g. 64-bit PCM) are scaled by their maximum value."""
+    conversion_map = {
+        "int16" : MAX_INT16,
+        "int32" : MAX_INT32,
+        "float32" : 1,
+        "float64" : 1,
+    }
+
+    if audio_data.dtype.name == "uint8":
+        float_data = (audio_data.astype(np.float32) - MAX_UINT8_HALF) / MAX_UINT8_HALF
+    elif audio_data.dtype.name in conversion_map:
+        float_data = audio_data.astype(np.float32) / conversion_map[audio_data.dtype.name]
+    elif np.issubdtype(audio_data.dtype, np.signedinteger):
+        float_data = audio_data.astype(np.float32) / np.iinfo(audio_data.dtype).max
+    else:
+        raise ValueError(f"Unsupported sample format {audio_data.dtype.name}")
+
+    # A mono file is a one-dimensional array
+    return float_data.reshape(-1, 1) if float_data.ndim == 1 else float_data
+
+def get_audio_file_sources(client: WaapiClient, selected_only: bool) -> list[dict]:
+    """Use waql to get all the Audio File Sources in the project, or only the ones under the selected objects."""
+    options = {"return": ["originalWavFilePath", "id", "name"]}
+
+    if not selected_only:
+        return client.call("ak.wwise.core.object.get",
+                           {"waql": "$ from type AudioFileSource"},
+                           options=options)["return"]
+
+    audio_files = []
+    selected_objects = client.call("ak.wwise.ui.getSelectedObjects")["objects"]
+
+    for objects in selected_objects:
+        audio_files += client.call("ak.wwise.core.object.get",
+                                   {"waql": f"$ \"{objects['id']}\" select descendants where type = \"AudioFileSource\""},
+                                   options=options)["return"]
+    return audio_files
+
+
+# ANALYSIS
+
+def analyze_audio_file(wav_file_path: str, threshold_linear: float) -> Optional[tuple]:
+    """Worker process entry point. Reads a .wav file and returns its statistics following CACHE_COLUMNS.
+    The whole file is analyzed at once with NumPy instead of traversing it sample by sample.
+    Returns None if the file can't be read or analyzed, so a single bad file doesn't abort the scan."""
+
+    try:
+        return get_audio_file_stats(wav_file_path, threshold_linear)
+    except Exception as e:
+        print(f"Could not read {wav_file_path}: {e}")
+        return None
+
+def get_audio_file_stats(wav_file_path: str, threshold_linear: float) -> tuple:
+    """Read a .wav file and compute its statistics following CACHE_COLUMNS."""
+
+    file_stat = os.stat(wav_file_path)
+    sample_rate, audio_data = wavfile.read(wav_file_path)
+
+    if sample_rate <= 0:
+        raise ValueError(f"Invalid sample rate {sample_rate}")
+
+    # Highest absolute value across all the channels of each sample
+    envelope = np.abs(convert_audio_data_to_float(audio_data)).max(axis=1)
+    num_samples: int = envelope.shape[0]
+    duration_in_seconds: float = num_samples / sample_rate
+    channels: int = 1 if audio_data.ndim == 1 else audio_data.shape[1]
+
+    peak = float(envelope.max()) if num_samples else 0.0
+    peak_db = 20 * np.log10(peak) if peak > 0 else -np.inf
+
+    above_threshold = np.flatnonzero(envelope > threshold_linear)
+
+    if above_threshold.size == 0:
+        leading_silence = trailing_silence = duration_in_seconds
+    else:
+        leading_silence = above_threshold[0] / sample_rate
+        trailing_silence = (num_samples - 1 - above_threshold[-1]) / sample_rate
+
+    return (wav_file_path, file_stat.st_mtime_ns, file_stat.st_size, duration_in_seconds, channels, sample_rate,
+            peak_db, leading_silence, trailing_silence)
+
+
+# CACHE
+
+def load_cache(cache_file: str, threshold: int) -> dict:
+    """Load the cached statistics of a previous scan, keyed by .wav file path.
+    The cache is discarded if it was created with a different threshold."""
+
+    if not os.path.isfile(cache_file):
+        return {}
+
+    # A corrupt or old-format cache only costs a full scan
+    try:
+        with np.load(cache_file) as cache_data:
+            if int(cache_data["threshold"]) != threshold or "path" not in cache_data:
+                return {}
+            columns = [cache_data[column].tolist() for column in CACHE_COLUMNS]
+    except Exception as e:
+        print(f"Could not load the cache {cache_file}, all files will be read: {e}")
+        return {}
+
+    return {row[0]: row for row in zip(*columns)}
+
+def save_cache(cache_file: str, threshold: int, rows: list[tuple]):
+    """Save the statistics of every scanned .wav file as columnar arrays."""
+    columns = {column: np.array(values) for column, values in zip(CACHE_COLUMNS, zip(*rows))} if rows else {}
+    np.savez(cache_file, threshold=threshold, **columns)
+
+def is_cache_entry_valid(cache_entry: Optional[tuple], wav_file_path: str) -> bool:
+    """Check if a .wav file is unchanged since it was cached by comparing its modification time and size."""
+    if cache_entry is None:
+        return False
+
+    try:
+        file_stat = os.stat(wav_file_path)
+    except OSError:
+        return False
+
+    return cache_entry[1] == file_stat.st_mtime_ns and cache_entry[2] == file_stat.st_size
+
+
+# REPORT
+
+def get_empty_stats(wav_file_path: str) -> tuple:
+    """Statistics following CACHE_COLUMNS for a file that couldn't be analyzed, with NaN measurements."""
+    return wav_file_path or "", 0, 0, np.nan, 0, 0, np.nan, np.nan, np.nan
+
+def write_report(report_file: str, report_format: str, audio_files: list[dict], stats: dict):
+    """Write one row per Audio File Source, as a CSV file or as NumPy columnar arrays.
+    Sources that couldn't be analyzed are written with NaN statistics and a status explaining why."""
+    rows = []
+
+    for audio_file in audio_files:
+        wav_file_path = audio_file.get("originalWavFilePath")
+
+        if not wav_file_path:
+            status, file_stats = STATUS_NO_PATH, get_empty_stats(wav_file_path)
+        elif wav_file_path not in stats:
+            status, file_stats = STATUS_UNREADABLE, get_empty_stats(wav_file_path)
+        else:
+            status, file_stats = STATUS_OK, stats[wav_file_path]
+
+        rows.append((audio_file["id"], audio_file["name"], status) + file_stats)
+
+    if report_format == "npz":
+        columns = {column: np.array(values) for column, values in zip(REPORT_COLUMNS, zip(*rows))} if rows else {}
+        np.savez_compressed(report_file, **columns)
+        return
+
+    with open(report_file, "w", newline="", encoding="utf-8") as report_csv_file:
+        writer = csv.writer(report_csv_file)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(rows)
+
+
+# MAIN PROCESS
+
+def main():
+
+    handle_py_asyncio_event_loop()
+
+    try:
+        config = parse_arguments()
+
+        # Waapi client connection, only needed to find the audio files
+        with WaapiClient(WAAPI_URL, WAAPI_ALLOW_EXCEPTIONS) as client:
+            audio_files = get_audio_file_sources(client, config.selected_only)
+
+        start_time = time.perf_counter()
+
+        os.makedirs(config.output_dir, exist_ok=True)
+        cache_file = os.path.join(config.output_dir, CACHE_FILE_NAME)
+        # A scan of the selected objects must not overwrite the project-wide report
+        report_file_name = SELECTED_REPORT_FILE_NAME if config.selected_only else REPORT_FILE_NAME
+        report_file = os.path.join(config.output_dir, f"{report_file_name}.{config.report_format}")
+
+        # The cache is shared by every scan. It's still loaded with --no_cache so the other entries are kept when saving
+        cache = load_cache(cache_file, config.threshold)
+        valid_cache = {} if config.no_cache else cache
+
+        # Several sources can share the same .wav file, read each file only once
+        wav_file_paths = sorted({audio_file["originalWavFilePath"] for audio_file in audio_files
+                                 if audio_file.get("originalWavFilePath")})
+
+        stats = {path: valid_cache[path] for path in wav_file_paths if is_cache_entry_valid(valid_cache.get(path), path)}
+        changed_paths = [path for path in wav_file_paths if path not in stats]
+
+        threshold_linear = get_threshold_value_linear(config.threshold)
+
+        try:
+            with ProcessPoolExecutor(max_workers=config.max_workers) as executor:
+                results = executor.map(analyze_audio_file, changed_paths, [threshold_linear] * len(changed_paths),
+                                       chunksize=DEFAULT_CHUNK_SIZE)
+                for result in results:
+                    if result is not None:
+                        stats[result[0]] = result
+        finally:
+            # Merge the results into the whole cache, so a partial scan keeps the entries of the other files.
+            # It's saved even if the worker pool breaks, so the files already analyzed aren't read again
+            cache.update(stats)
+            save_cache(cache_file, config.threshold, list(cache.values()))
+
+        write_report(report_file, config.report_format, audio_files, stats)
+
+        failed_count = len([path for path in wav_file_paths if path not in stats])
+        no_path_count = len(audio_files) - len([audio_file for audio_file in audio_files
+                                                if audio_file.get("originalWavFilePath")])
+
+        print(f"Scanned {len(audio_files)} sources ({len(wav_file_paths)} files, {len(changed_paths)} read, "
+              f"{len(wav_file_paths) - len(changed_paths)} cached) in {time.perf_counter() - start_time:.2f}s")
+        if failed_count or no_path_count:
+            print(f"{failed_count} files could not be read and {no_path_count} sources have no file, "
+                  f"see the '{STATUS_UNREADABLE}' and '{STATUS_NO_PATH}' rows in the report")
+        print(f"Report written to {report_file}")
+
+    except CannotConnectToWaapiException:
+        print("Could not connect to waapi. Ensure Wwise is running and waapi is enabled.")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+if __name__ == "__main__":
+    main()